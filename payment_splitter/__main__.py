@@ -1,11 +1,12 @@
 """Command-line entrypoint."""
 import argparse
 import json
+import os
 
 from .main import main
 
 
-def parse_args() -> tuple[str, bool]:
+def parse_args() -> tuple[str, bool, int | None, str | None, str | None, int]:
     parser = argparse.ArgumentParser(
         prog="PaymentSplitter",
         description="Finds settle-up payments in Pocketsmith, and splits them into the constituent expenses from Splitwise.",
@@ -22,12 +23,58 @@ def parse_args() -> tuple[str, bool]:
         help="Don't split the Pocketsmith transactions, just log what would have been created. Useful for verifying that it is working as expected.",
     )
 
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--listen",
+        type=int,
+        metavar="PORT",
+        help="Instead of a single full run, listen on the given local port for notifications about single Pocketsmith transactions or Splitwise expenses, and process them as they arrive.",
+    )
+    mode.add_argument(
+        "--plan",
+        metavar="PLAN_FILE",
+        help="Don't split the Pocketsmith transactions, just write the planned splits to the given file, to be checked and then applied with --apply.",
+    )
+    mode.add_argument(
+        "--apply",
+        metavar="PLAN_FILE",
+        help="Split the Pocketsmith transactions in a file written by --plan, without matching them again. Transactions that have changed since the plan was written are skipped.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        help="Number of transactions to split at the same time. Only valid with --apply. Defaults to 8.",
+    )
+
     args = vars(parser.parse_args())
 
-    return (args["config-file"], args["dry_run"])
+    if args["workers"] is not None and args["apply"] is None:
+        parser.error("argument --workers: only allowed with argument --apply")
+
+    return (
+        args["config-file"],
+        args["dry_run"],
+        args["listen"],
+        args["plan"],
+        args["apply"],
+        args["workers"] or 8,
+    )
+
+
+def positive_int(value: str) -> int:
+    """Parse a command-line argument as an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+
+    return number
 
 
-def parse_config(config_file_path: str) -> tuple[str, str, str, list[int]]:
+def parse_config(config_file_path: str) -> tuple[str, str, str, list[int], float]:
     try:
         with open(config_file_path, "r") as f:
             config = json.load(f)
@@ -37,6 +84,7 @@ def parse_config(config_file_path: str) -> tuple[str, str, str, list[int]]:
                 config["pocketsmith_api_key"],
                 config["splitwise_api_key"],
                 config["splitwise_groups"],
+                config.get("identity_ttl", 3600),
             )
     except OSError as e:
         raise Exception("Could not open configuration file.") from e
@@ -46,6 +94,24 @@ def parse_config(config_file_path: str) -> tuple[str, str, str, list[int]]:
         raise Exception("Missing a key in the config file.") from e
 
 
-config_file, dry_run = parse_args()
-user_name, pocketsmith_key, splitwise_key, splitwise_groups = parse_config(config_file)
-main(user_name, pocketsmith_key, splitwise_key, splitwise_groups, dry_run=dry_run)
+config_file, dry_run, listen_port, plan_path, apply_path, max_workers = parse_args()
+(
+    user_name,
+    pocketsmith_key,
+    splitwise_key,
+    splitwise_groups,
+    identity_ttl,
+) = parse_config(config_file)
+main(
+    user_name,
+    pocketsmith_key,
+    splitwise_key,
+    splitwise_groups,
+    dry_run=dry_run,
+    listen_port=listen_port,
+    plan_path=plan_path,
+    apply_path=apply_path,
+    identity_ttl=identity_ttl,
+    cache_path=f"{os.path.splitext(config_file)[0]}.cache.json",
+    max_workers=max_workers,
+)
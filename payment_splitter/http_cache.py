@@ -0,0 +1,217 @@
+"""Module for caching parsed API responses between requests and between runs."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+def send_request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request, waiting and retrying if it is rate limited with a 429 response.
+
+    Waits for the number of seconds in the Retry-After header if there is one, or backs off exponentially otherwise.
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES):
+        response = requests.request(method, url, **kwargs)
+
+        if response.status_code != requests.codes.too_many_requests:
+            return response
+
+        retry_after = response.headers.get("Retry-After", "")
+        time.sleep(float(retry_after) if retry_after.isdigit() else 2**attempt)
+
+    return requests.request(method, url, **kwargs)
+
+
+@dataclass
+class CachedResponse(Generic[T]):
+    """An API response, along with the validators needed to revalidate it.
+
+    payload is the decoded JSON body, and value is the parsed model objects, which are
+    only created when the response is first used in this run.
+    """
+
+    payload: Any
+    links: dict
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    value: T | None = field(default=None, compare=False)
+    is_parsed: bool = field(default=False, compare=False)
+
+
+class ResponseCache:
+    """Cache of GET responses, which revalidates them with conditional requests.
+
+    Responses with an ETag or Last-Modified header are revalidated with If-None-Match or
+    If-Modified-Since, and the previously parsed value is reused if the server responds
+    with 304 Not Modified. Responses fetched with a ttl are reused without any request
+    until they are older than the ttl.
+
+    If a path is given, the cache is loaded from it, and save writes it back, so that
+    the validators are reused by the next run.
+    """
+
+    def __init__(self, path: str | None = None, max_entries: int = 1024) -> None:
+        self._path = path
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, CachedResponse[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._logger = logging.getLogger("ResponseCache")
+        self._logger.setLevel(logging.INFO)
+
+        if path is not None:
+            self._load(path)
+
+    def get(
+        self,
+        url: str,
+        headers: dict,
+        parse: Callable[[Any], T],
+        params: dict = {},
+        ttl: float | None = None,
+        cacheable: bool = True,
+    ) -> CachedResponse[T]:
+        """GET the given url, parsing the JSON body with parse unless the cached value is still valid.
+
+        Requests with cacheable set to False are always sent unconditionally, and their responses are not stored.
+        """
+        key = (url, tuple(sorted(params.items())), self._digest(headers))
+        entry = None
+        if cacheable:
+            with self._lock:
+                entry = self._entries.get(key)
+
+        if (
+            entry is not None
+            and ttl is not None
+            and time.time() - entry.fetched_at < ttl
+        ):
+            return self._parsed(entry, parse)
+
+        request_headers = dict(headers)
+        if entry is not None and entry.etag is not None:
+            request_headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = send_request("GET", url, headers=request_headers, params=params)
+
+        if response.status_code == requests.codes.not_modified:
+            if entry is None:
+                raise requests.exceptions.HTTPError(
+                    "Received 304 Not Modified for a request with no cached response.",
+                    response=response,
+                )
+
+            entry.fetched_at = time.time()
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return self._parsed(entry, parse)
+
+        response.raise_for_status()
+
+        entry = CachedResponse(
+            payload=response.json(),
+            links=response.links,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=time.time(),
+        )
+
+        if cacheable:
+            with self._lock:
+                if entry.etag or entry.last_modified or ttl is not None:
+                    self._store(key, entry)
+                else:
+                    self._entries.pop(key, None)
+
+        return self._parsed(entry, parse)
+
+    def save(self) -> None:
+        """Write the cache to its path, if it has one."""
+        if self._path is None:
+            return
+
+        with self._lock:
+            records = [
+                {
+                    "url": url,
+                    "params": params,
+                    "headers_digest": headers_digest,
+                    "payload": entry.payload,
+                    "links": entry.links,
+                    "etag": entry.etag,
+                    "last_modified": entry.last_modified,
+                    "fetched_at": entry.fetched_at,
+                }
+                for (url, params, headers_digest), entry in self._entries.items()
+            ]
+
+        # write to a temporary file first, so an interrupted save can't corrupt the cache
+        temporary_path = f"{self._path}.tmp"
+        try:
+            with open(temporary_path, "w") as f:
+                json.dump(records, f)
+            os.replace(temporary_path, self._path)
+        except OSError:
+            self._logger.warning("Could not save the response cache.")
+
+    def _load(self, path: str) -> None:
+        """Load the entries saved to the given path, starting empty if they could not be read."""
+        try:
+            with open(path, "r") as f:
+                records = json.load(f)
+
+            for record in records:
+                key = (
+                    record["url"],
+                    tuple(tuple(param) for param in record["params"]),
+                    record["headers_digest"],
+                )
+                self._entries[key] = CachedResponse(
+                    payload=record["payload"],
+                    links=record["links"],
+                    etag=record["etag"],
+                    last_modified=record["last_modified"],
+                    fetched_at=record["fetched_at"],
+                )
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            self._logger.warning("Could not read the response cache, starting empty.")
+            self._entries.clear()
+
+    def _digest(self, headers: dict) -> str:
+        """Get a digest of the given headers, so that responses for different API keys are kept apart without storing the keys."""
+        return hashlib.sha256(json.dumps(sorted(headers.items())).encode()).hexdigest()
+
+    def _parsed(
+        self, entry: CachedResponse[Any], parse: Callable[[Any], T]
+    ) -> CachedResponse[T]:
+        """Parse the entry's payload, unless it has already been parsed in this run."""
+        if not entry.is_parsed:
+            entry.value = parse(entry.payload)
+            entry.is_parsed = True
+
+        return entry
+
+    def _store(self, key: tuple, entry: CachedResponse[Any]) -> None:
+        """Store the given entry, evicting the least recently used entry if the cache is full. Must be called with the lock held."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
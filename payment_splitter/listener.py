@@ -0,0 +1,221 @@
+"""Module for processing settle-up transactions as notifications arrive."""
+import logging
+import queue
+import re
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .pocketsmith.model import PsTransaction
+from .pocketsmith.service import PocketsmithService
+from .processor import process_settle_up_transaction
+from .splitwise.service import SplitwiseService
+
+POCKETSMITH = "pocketsmith"
+SPLITWISE = "splitwise"
+
+EVENT_PATHS = {
+    POCKETSMITH: re.compile(r"^/pocketsmith/transactions/(\d+)$"),
+    SPLITWISE: re.compile(r"^/splitwise/expenses/(\d+)$"),
+}
+
+
+class EventListener:
+    """Local HTTP listener which reconciles single transactions as notifications arrive.
+
+    Notifications are POSTed to /pocketsmith/transactions/<id> or /splitwise/expenses/<id>.
+    Repeated notifications for an item that is still queued are coalesced, and new
+    notifications are rejected with a 503 while the queue is full.
+    """
+
+    def __init__(
+        self,
+        pocketsmith: PocketsmithService,
+        splitwise: SplitwiseService,
+        splitwise_groups: list,
+        dry_run: bool = False,
+        max_queue_size: int = 100,
+        coalesce_seconds: float = 0.5,
+    ) -> None:
+        self._pocketsmith = pocketsmith
+        self._splitwise = splitwise
+        self._splitwise_groups = splitwise_groups
+        self._dry_run = dry_run
+        self._coalesce_seconds = coalesce_seconds
+
+        self._queue: queue.Queue[tuple[str, int]] = queue.Queue(max_queue_size)
+        self._pending: set[tuple[str, int]] = set()
+        self._pending_lock = threading.Lock()
+
+        self._settle_up_transactions: dict[int, PsTransaction] = {}
+
+        self._logger = logging.getLogger("EventListener")
+        self._logger.setLevel(logging.INFO)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """Warm the in-memory indexes, then process notifications until interrupted."""
+        self._warm_indexes()
+
+        worker = threading.Thread(target=self._work, daemon=True)
+        worker.start()
+
+        server = ThreadingHTTPServer((host, port), partial(_EventRequestHandler, self))
+        self._logger.info(f"Listening for notifications on {host}:{port}.")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self._logger.info("Stopping listener.")
+        finally:
+            server.server_close()
+
+    def submit(self, source: str, item_id: int) -> bool:
+        """Queue a notification for the given item. Returns False if the queue is full."""
+        event = (source, item_id)
+
+        with self._pending_lock:
+            if event in self._pending:
+                return True
+
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                return False
+
+            self._pending.add(event)
+
+        return True
+
+    def _warm_indexes(self) -> None:
+        """Load the settle-up transactions and Splitwise transactions into memory."""
+        self._settle_up_transactions = {
+            txn.id: txn for txn in self._pocketsmith.get_settle_up_transactions()
+        }
+        self._splitwise.update_expenses()
+
+        self._logger.info(
+            f"Loaded {len(self._settle_up_transactions)} settle-up transactions."
+        )
+
+    def _work(self) -> None:
+        """Take bursts of notifications off the queue and process them."""
+        while True:
+            events = self._next_batch()
+
+            # pick up all Splitwise changes first, including constituent expenses that
+            # weren't notified on their own, so that the splits match against them
+            self._try(self._splitwise.update_expenses)
+            for source, item_id in events:
+                if source == SPLITWISE:
+                    self._try(self._handle_splitwise_event, item_id)
+            for source, item_id in events:
+                if source == POCKETSMITH:
+                    self._try(self._handle_pocketsmith_event, item_id)
+
+    def _next_batch(self) -> list[tuple[str, int]]:
+        """Block until a notification arrives, then collect any others that arrive within the coalescing window."""
+        events = [self._queue.get()]
+        deadline = time.monotonic() + self._coalesce_seconds
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                events.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        with self._pending_lock:
+            self._pending.difference_update(events)
+
+        # remove duplicates while preserving order
+        return list(dict.fromkeys(events))
+
+    def _handle_pocketsmith_event(self, transaction_id: int) -> None:
+        """Reconcile a single Pocketsmith transaction."""
+        transaction = self._pocketsmith.get_settle_up_transaction(transaction_id)
+
+        if transaction is None:
+            self._logger.info(
+                f"Transaction {transaction_id} is not a settle-up transaction, ignoring."
+            )
+            self._settle_up_transactions.pop(transaction_id, None)
+            return
+
+        self._settle_up_transactions[transaction.id] = transaction
+        self._process(transaction)
+
+    def _handle_splitwise_event(self, expense_id: int) -> None:
+        """Refresh a single Splitwise transaction, and reconcile any settle-up transaction it pays for."""
+        expense = self._splitwise.refresh_expense(expense_id)
+
+        if not expense.payment or expense.deleted_at is not None:
+            return
+
+        if self._splitwise_groups and expense.group_id not in self._splitwise_groups:
+            return
+
+        candidate_transactions = [
+            txn
+            for txn in self._settle_up_transactions.values()
+            if self._splitwise.is_matching_payment(
+                expense, txn.get_amount(), txn.get_date()
+            )
+        ]
+
+        for transaction in candidate_transactions:
+            self._try(self._process, transaction)
+
+    def _process(self, transaction: PsTransaction) -> None:
+        """Split the given settle-up transaction, dropping it from the index once split."""
+        is_split = process_settle_up_transaction(
+            self._pocketsmith,
+            self._splitwise,
+            transaction,
+            self._splitwise_groups,
+            self._dry_run,
+        )
+
+        if is_split and not self._dry_run:
+            self._settle_up_transactions.pop(transaction.id, None)
+
+    def _try(self, func, *args) -> None:
+        """Call the given function, logging rather than raising any errors so the worker keeps running."""
+        try:
+            func(*args)
+        except Exception:
+            self._logger.exception("Error occurred while processing a notification.")
+
+
+class _EventRequestHandler(BaseHTTPRequestHandler):
+    """Request handler which passes notifications on to the event listener."""
+
+    def __init__(self, listener: EventListener, *args) -> None:
+        self._listener = listener
+        super().__init__(*args)
+
+    def do_POST(self) -> None:
+        """Queue a notification for the item in the request path."""
+        for source, pattern in EVENT_PATHS.items():
+            match = pattern.match(self.path)
+            if match is not None:
+                break
+        else:
+            self._respond(404)
+            return
+
+        if self._listener.submit(source, int(match[1])):
+            self._respond(202)
+        else:
+            self._respond(503, {"Retry-After": "1"})
+
+    def log_message(self, format: str, *args) -> None:
+        """Send request logs through the listener's logger instead of stderr."""
+        logging.getLogger("EventListener").debug(format % args)
+
+    def _respond(self, status: int, headers: dict = {}) -> None:
+        """Send an empty response with the given status code."""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
@@ -2,7 +2,11 @@
 import logging
 import sys
 
+from .http_cache import ResponseCache
+from .listener import EventListener
+from .plan import read_plan, write_plan
 from .pocketsmith.service import PocketsmithService
+from .processor import plan_settle_up_transaction, process_settle_up_transaction
 from .splitwise.service import SplitwiseService
 
 
@@ -12,6 +16,12 @@ def main(
     splitwise_key: str,
     splitwise_groups: list,
     dry_run: bool = False,
+    listen_port: int | None = None,
+    plan_path: str | None = None,
+    apply_path: str | None = None,
+    identity_ttl: float = 3600,
+    cache_path: str | None = None,
+    max_workers: int = 8,
 ):
     """Run the payment splitter."""
     logging.basicConfig(
@@ -22,42 +32,58 @@ def main(
     logger = logging.getLogger("Main")
     logger.setLevel(logging.INFO)
 
-    pocketsmith = PocketsmithService.factory(pocketsmith_key)
-    splitwise = SplitwiseService.factory(splitwise_key)
+    cache = ResponseCache(cache_path)
+    pocketsmith = PocketsmithService.factory(pocketsmith_key, cache, identity_ttl)
+    splitwise = SplitwiseService.factory(splitwise_key, cache, identity_ttl)
 
-    pocketsmith_transactions = pocketsmith.get_settle_up_transactions()
-
-    if pocketsmith_transactions:
-        logger.info(
-            f"Found {len(pocketsmith_transactions)} settle-up transactions for user {user_name}."
-        )
-
-    for settle_up_transaction in pocketsmith_transactions:
-        logger.info(f"Processing settle-up transaction: {settle_up_transaction}")
+    try:
+        if listen_port is not None:
+            listener = EventListener(
+                pocketsmith, splitwise, splitwise_groups, dry_run=dry_run
+            )
+            listener.serve(listen_port)
+            return
 
-        sw_payment = splitwise.get_matching_payment(
-            settle_up_transaction.get_amount(),
-            settle_up_transaction.get_date(),
-            splitwise_groups,
-        )
+        if apply_path is not None:
+            plans = read_plan(apply_path)
+            logger.info(f"Applying {len(plans)} planned splits for user {user_name}.")
+            pocketsmith.save_all_split_transactions(
+                [(plan.transaction, plan.get_expenses()) for plan in plans],
+                max_workers,
+                dry_run,
+            )
+            return
 
-        if sw_payment is None:
-            logger.warn(f"No matching splitwise payment found, skipping.")
-            continue
+        pocketsmith_transactions = pocketsmith.get_settle_up_transactions()
 
-        logger.info(f"Found matching splitwise payment: {sw_payment}")
+        if pocketsmith_transactions:
+            logger.info(
+                f"Found {len(pocketsmith_transactions)} settle-up transactions for user {user_name}."
+            )
 
-        constituent_expenses = splitwise.get_constituent_expenses(sw_payment)
+        if plan_path is not None:
+            plans = []
+            for settle_up_transaction in pocketsmith_transactions:
+                try:
+                    plan = plan_settle_up_transaction(
+                        splitwise, settle_up_transaction, splitwise_groups
+                    )
+                except Exception:
+                    logger.exception(
+                        f"Could not plan settle-up transaction {settle_up_transaction.id}, skipping."
+                    )
+                    continue
 
-        if constituent_expenses is None:
-            logger.warn(
-                f"Could not split payment into its constituent expenses, skipping."
-            )
-            continue
+                if plan is not None:
+                    plans.append(plan)
 
-        logger.info(f"Found constituent expenses: {constituent_expenses}")
+            write_plan(plan_path, plans)
+            logger.info(f"Wrote {len(plans)} planned splits to {plan_path}.")
+            return
 
-        if not dry_run:
-            pocketsmith.save_split_transactions(
-                settle_up_transaction, constituent_expenses
+        for settle_up_transaction in pocketsmith_transactions:
+            process_settle_up_transaction(
+                pocketsmith, splitwise, settle_up_transaction, splitwise_groups, dry_run
             )
+    finally:
+        cache.save()
@@ -0,0 +1,62 @@
+"""Module for reading and writing split plans."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from .pocketsmith.model import PsTransaction
+from .splitwise.model import SwTransaction
+from .util import to_decimal
+
+
+class PlannedExpense(BaseModel):
+    """Model representing one of the constituent expenses in a split plan."""
+
+    description: str
+    amount: str
+
+
+class SplitPlan(BaseModel):
+    """Model representing the planned split of a single settle-up transaction."""
+
+    transaction: PsTransaction
+    splitwise_payment_id: int
+    expenses: list[PlannedExpense]
+
+    @classmethod
+    def create(
+        cls,
+        transaction: PsTransaction,
+        payment: SwTransaction,
+        expenses: list[tuple[str, Decimal]],
+    ) -> SplitPlan:
+        """Create the plan for splitting the given settle-up transaction into the given expenses."""
+        return cls(
+            transaction=transaction,
+            splitwise_payment_id=payment.id,
+            expenses=[
+                PlannedExpense(description=description, amount=str(amount))
+                for description, amount in expenses
+            ],
+        )
+
+    def get_expenses(self) -> list[tuple[str, Decimal]]:
+        """Get the planned expenses as tuples (description, amount)."""
+        return [
+            (expense.description, to_decimal(expense.amount))
+            for expense in self.expenses
+        ]
+
+
+def write_plan(plan_file_path: str, plans: list[SplitPlan]) -> None:
+    """Write the given split plans to a file, one JSON object per line."""
+    with open(plan_file_path, "w") as f:
+        for plan in plans:
+            f.write(plan.json() + "\n")
+
+
+def read_plan(plan_file_path: str) -> list[SplitPlan]:
+    """Read the split plans from a file written by write_plan."""
+    with open(plan_file_path, "r") as f:
+        return [SplitPlan.parse_raw(line) for line in f if line.strip()]
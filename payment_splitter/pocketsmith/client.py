@@ -3,56 +3,79 @@ import logging
 
 import requests
 
+from ..http_cache import ResponseCache, send_request
 from .model import PsTransaction, PsUser
 
 
 class PocketsmithClient:
     """Client for interacting with the Pocketsmith API."""
 
-    def __init__(self, key: str) -> None:
+    def __init__(
+        self,
+        key: str,
+        cache: ResponseCache | None = None,
+        identity_ttl: float = 3600,
+    ) -> None:
         self._key = key
+        self._identity_ttl = identity_ttl
+
+        self._cache = cache if cache is not None else ResponseCache()
 
         self._logger = logging.getLogger("PocketsmithClient")
         self._logger.setLevel(logging.INFO)
 
     def get_user(self) -> PsUser:
-        """Get the current user from the Pocketsmith API."""
+        """Get the current user from the Pocketsmith API, with caching."""
         url = "https://api.pocketsmith.com/v2/me"
         headers = {"X-Developer-Key": self._key, "accept": "application/json"}
 
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        user_dict = response.json()
+        response = self._cache.get(
+            url,
+            headers,
+            lambda payload: PsUser(**payload),
+            ttl=self._identity_ttl,
+        )
+
+        return response.value
 
-        user = PsUser(**user_dict)
+    def get_transaction(self, transaction_id: int) -> PsTransaction:
+        """Get a single transaction by id from the Pocketsmith API."""
+        url = f"https://api.pocketsmith.com/v2/transactions/{transaction_id}"
+        headers = {"X-Developer-Key": self._key, "accept": "application/json"}
 
-        return user
+        response = self._cache.get(
+            url, headers, lambda payload: PsTransaction(**payload)
+        )
+
+        return response.value
 
     def get_transactions(self, user_id: int, params: dict = {}) -> list[PsTransaction]:
         """Get the list of transactions for the given user from the Pocketsmith API."""
         url = f"https://api.pocketsmith.com/v2/users/{user_id}/transactions"
         headers = {"X-Developer-Key": self._key, "accept": "application/json"}
 
-        transaction_dicts: list[dict] = []
+        transactions: list[PsTransaction] = []
         while url is not None:
             try:
-                response = requests.get(url, headers=headers, params=params)
-                response.raise_for_status()
+                response = self._cache.get(
+                    url,
+                    headers,
+                    lambda payload: [PsTransaction(**txn) for txn in payload],
+                    params,
+                )
             except requests.exceptions.ConnectionError:
                 self._logger.error(
                     "Connection error while reading transactions from Pocketsmith."
                 )
                 return []
 
-            transaction_dicts.extend(response.json())
+            transactions.extend(response.value)
 
             if "link" not in response.links:
                 break
 
             url = response.links["next"]
 
-        transactions = [PsTransaction(**txn) for txn in transaction_dicts]
-
         return transactions
 
     def create_transaction(
@@ -63,7 +86,7 @@ class PocketsmithClient:
         headers = {"X-Developer-Key": self._key, "accept": "application/json"}
 
         try:
-            response = requests.post(url, headers=headers, data=transaction_dict)
+            response = send_request("POST", url, headers=headers, data=transaction_dict)
             response.raise_for_status()
         except requests.exceptions.ConnectionError:
             self._logger.error(
@@ -81,7 +104,7 @@ class PocketsmithClient:
         headers = {"X-Developer-Key": self._key, "accept": "application/json"}
 
         try:
-            response = requests.delete(url, headers=headers)
+            response = send_request("DELETE", url, headers=headers)
             response.raise_for_status()
         except requests.exceptions.ConnectionError:
             self._logger.error(
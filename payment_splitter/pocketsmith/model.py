@@ -20,6 +20,12 @@ class PsTransactionAccount(BaseModel):
     id: int
 
 
+class PsCategory(BaseModel):
+    """Model representing a category object returned from the Pocketsmith API."""
+
+    id: int
+
+
 class PsTransaction(BaseModel):
     """Model representing a transaction object returned from the Pocketsmith API."""
 
@@ -30,6 +36,7 @@ class PsTransaction(BaseModel):
     note: str | None
     labels: list[str]
     transaction_account: PsTransactionAccount
+    category: PsCategory | None = None
 
     def get_date(self) -> datetime:
         """Get the date for this transaction as a timezone-aware datetime object."""
@@ -1,6 +1,8 @@
 """Module for retrieving transactions from Pocketsmith."""
 import logging
 
+import requests
+
 from .client import PocketsmithClient
 from .model import PsTransaction
 
@@ -23,7 +25,25 @@ class PocketsmithRetriever:
             {"uncategorised": 1, "search": "splitwise"},
         )
         settle_up_transactions = [
-            txn for txn in transactions if "Splitwise" in txn.labels
+            txn for txn in transactions if self._is_settle_up(txn)
         ]
 
         return settle_up_transactions
+
+    def get_settle_up_transaction(self, transaction_id: int) -> PsTransaction | None:
+        """Get a single settle-up transaction by id, or None if it is not an uncategorised settle-up transaction."""
+        try:
+            transaction = self._client.get_transaction(transaction_id)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+        if not self._is_settle_up(transaction):
+            return None
+
+        return transaction
+
+    def _is_settle_up(self, transaction: PsTransaction) -> bool:
+        """Check if the given transaction is an uncategorised transaction labelled as a settle-up payment."""
+        return transaction.category is None and "Splitwise" in transaction.labels
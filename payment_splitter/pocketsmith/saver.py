@@ -1,7 +1,10 @@
 """Module for saving Pocketsmith transactions."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
+import requests
+
 from .client import PocketsmithClient
 from .model import PsTransaction
 
@@ -15,12 +18,84 @@ class PocketsmithSaver:
         self._logger = logging.getLogger("PocketsmithSaver")
         self._logger.setLevel(logging.INFO)
 
+    def save_all_split_transactions(
+        self,
+        splits: list[tuple[PsTransaction, list[tuple[str, Decimal]]]],
+        max_workers: int = 8,
+        dry_run: bool = False,
+    ) -> None:
+        """Save many split transactions concurrently, skipping any whose original has changed since it was split.
+
+        splits is a list of tuples (original_transaction, new_transactions), as passed to save_split_transactions
+        dry_run checks the originals and logs the splits, without saving them
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            saved = list(
+                executor.map(
+                    lambda split: self._save_if_unchanged(*split, dry_run), splits
+                )
+            )
+
+        if dry_run:
+            self._logger.info(
+                f"Would split {sum(saved)} of {len(splits)} transactions."
+            )
+        else:
+            self._logger.info(f"Split {sum(saved)} of {len(splits)} transactions.")
+
+    def _save_if_unchanged(
+        self,
+        original_transaction: PsTransaction,
+        new_transactions: list[tuple[str, Decimal]],
+        dry_run: bool,
+    ) -> bool:
+        """Save the split transactions if the original is unchanged in Pocketsmith. Returns whether they were (or would be) saved."""
+        try:
+            current_transaction = self._client.get_transaction(original_transaction.id)
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                self._logger.exception(
+                    f"Could not read transaction {original_transaction.id}, skipping."
+                )
+                return False
+
+            self._logger.info(
+                f"Transaction {original_transaction.id} was already split or deleted, skipping."
+            )
+            return False
+        except Exception:
+            self._logger.exception(
+                f"Could not read transaction {original_transaction.id}, skipping."
+            )
+            return False
+
+        if current_transaction != original_transaction:
+            self._logger.warning(
+                f"Transaction has changed since it was split, skipping: {original_transaction}"
+            )
+            return False
+
+        if dry_run:
+            self._logger.info(
+                f"Would split transaction {original_transaction} into: {new_transactions}"
+            )
+            return True
+
+        try:
+            return self.save_split_transactions(original_transaction, new_transactions)
+        except Exception:
+            # the rollback itself failed, so some created transactions may remain
+            self._logger.exception(
+                f"Could not split or roll back transaction {original_transaction.id}."
+            )
+            return False
+
     def save_split_transactions(
         self,
         original_transaction: PsTransaction,
         new_transactions: list[tuple[str, Decimal]],
-    ) -> None:
-        """Save the newly created pocketsmith transactions, and delete the original.
+    ) -> bool:
+        """Save the newly created pocketsmith transactions, and delete the original. Returns whether they were saved.
 
         original_transaction is the original transaction in pocketsmith format
         new_transactions is the list of new transactions in an intermediate format
@@ -45,10 +120,14 @@ class PocketsmithSaver:
                 created_transaction_ids.append(response_transaction.id)
 
             self._client.delete_transaction(original_transaction.id)
-            self._logger.info(f"Split transaction into its constituents.")
+            self._logger.info(
+                f"Split transaction {original_transaction.id} into its constituents."
+            )
+            return True
         except Exception:
             self._logger.error("Error occurred while creating new transactions.")
             # rollback created transactions
             for created_transaction_id in created_transaction_ids:
                 self._client.delete_transaction(created_transaction_id)
             self._logger.info("Rolled back all changes, no transactions were created.")
+            return False
@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 from decimal import Decimal
 
+from ..http_cache import ResponseCache
 from .client import PocketsmithClient
 from .model import PsTransaction
 from .retriever import PocketsmithRetriever
@@ -25,9 +26,14 @@ class PocketsmithService:
         self._logger.setLevel(logging.INFO)
 
     @classmethod
-    def factory(cls, key: str) -> PocketsmithService:
+    def factory(
+        cls,
+        key: str,
+        cache: ResponseCache | None = None,
+        identity_ttl: float = 3600,
+    ) -> PocketsmithService:
         """Factory method for creating the Pocketsmith service."""
-        client = PocketsmithClient(key)
+        client = PocketsmithClient(key, cache, identity_ttl)
         retriever = PocketsmithRetriever(client)
         splitter = PocketsmithSaver(client)
 
@@ -37,14 +43,33 @@ class PocketsmithService:
         """Get a list of the uncategorised settle-up transactions in Pocketsmith."""
         return self._retriever.get_settle_up_transactions()
 
+    def get_settle_up_transaction(self, transaction_id: int) -> PsTransaction | None:
+        """Get a single settle-up transaction by id, or None if it is not an uncategorised settle-up transaction."""
+        return self._retriever.get_settle_up_transaction(transaction_id)
+
     def save_split_transactions(
         self,
         original_transaction: PsTransaction,
         new_transactions: list[tuple[str, Decimal]],
-    ) -> None:
-        """Save the newly created pocketsmith transactions, and delete the original.
+    ) -> bool:
+        """Save the newly created pocketsmith transactions, and delete the original. Returns whether they were saved.
 
         original_transaction is the original transaction in pocketsmith format
         new_transactions is the list of new transactions in an intermediate format
         """
-        self._saver.save_split_transactions(original_transaction, new_transactions)
+        return self._saver.save_split_transactions(
+            original_transaction, new_transactions
+        )
+
+    def save_all_split_transactions(
+        self,
+        splits: list[tuple[PsTransaction, list[tuple[str, Decimal]]]],
+        max_workers: int = 8,
+        dry_run: bool = False,
+    ) -> None:
+        """Save many split transactions concurrently, skipping any whose original has changed since it was split.
+
+        splits is a list of tuples (original_transaction, new_transactions), as passed to save_split_transactions
+        dry_run checks the originals and logs the splits, without saving them
+        """
+        self._saver.save_all_split_transactions(splits, max_workers, dry_run)
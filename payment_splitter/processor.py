@@ -0,0 +1,62 @@
+"""Module for processing individual settle-up transactions."""
+import logging
+
+from .plan import SplitPlan
+from .pocketsmith.model import PsTransaction
+from .pocketsmith.service import PocketsmithService
+from .splitwise.service import SplitwiseService
+
+
+def plan_settle_up_transaction(
+    splitwise: SplitwiseService,
+    settle_up_transaction: PsTransaction,
+    splitwise_groups: list,
+) -> SplitPlan | None:
+    """Match a single settle-up transaction to its constituent expenses. Returns None if they could not be found."""
+    logger = logging.getLogger("Processor")
+    logger.setLevel(logging.INFO)
+
+    logger.info(f"Processing settle-up transaction: {settle_up_transaction}")
+
+    sw_payment = splitwise.get_matching_payment(
+        settle_up_transaction.get_amount(),
+        settle_up_transaction.get_date(),
+        splitwise_groups,
+    )
+
+    if sw_payment is None:
+        logger.warn(f"No matching splitwise payment found, skipping.")
+        return None
+
+    logger.info(f"Found matching splitwise payment: {sw_payment}")
+
+    constituent_expenses = splitwise.get_constituent_expenses(sw_payment)
+
+    if constituent_expenses is None:
+        logger.warn(f"Could not split payment into its constituent expenses, skipping.")
+        return None
+
+    logger.info(f"Found constituent expenses: {constituent_expenses}")
+
+    return SplitPlan.create(settle_up_transaction, sw_payment, constituent_expenses)
+
+
+def process_settle_up_transaction(
+    pocketsmith: PocketsmithService,
+    splitwise: SplitwiseService,
+    settle_up_transaction: PsTransaction,
+    splitwise_groups: list,
+    dry_run: bool = False,
+) -> bool:
+    """Split a single settle-up transaction into its constituent expenses. Returns whether it was split."""
+    plan = plan_settle_up_transaction(
+        splitwise, settle_up_transaction, splitwise_groups
+    )
+
+    if plan is None:
+        return False
+
+    if dry_run:
+        return True
+
+    return pocketsmith.save_split_transactions(plan.transaction, plan.get_expenses())
@@ -1,34 +1,110 @@
-import requests
+from datetime import datetime, timedelta, timezone
 
+from ..http_cache import ResponseCache
 from .model import SwTransaction, SwUser
 
+# re-fetch transactions updated shortly before the last fetch, in case of clock skew or
+# transactions written on the server while the last fetch was in progress
+UPDATED_AFTER_OVERLAP = timedelta(minutes=5)
+
 
 class SplitwiseClient:
     """Class for interacting with the Splitwise API."""
 
-    def __init__(self, key: str) -> None:
+    def __init__(
+        self,
+        key: str,
+        cache: ResponseCache | None = None,
+        identity_ttl: float = 3600,
+    ) -> None:
         self._key = key
+        self._identity_ttl = identity_ttl
 
+        self._cache = cache if cache is not None else ResponseCache()
         self._transactions: list[SwTransaction] | None = None
-        self._user: SwUser | None = None
+        self._transactions_updated_at: datetime | None = None
 
     def get_all_transactions(self) -> list[SwTransaction]:
         """Get all transactions from the Splitwise API, with caching."""
         if self._transactions is not None:
             return self._transactions
 
+        updated_at = datetime.now(timezone.utc)
+        transactions = [
+            txn for txn in self._get_transactions() if txn.deleted_at is None
+        ]
+
+        self._transactions = transactions
+        self._transactions_updated_at = updated_at
+
+        return transactions
+
+    def update_transactions(self) -> list[SwTransaction]:
+        """Merge any transactions updated since the last fetch into the cache, and return the updated transactions."""
+        if self._transactions_updated_at is None:
+            return self.get_all_transactions()
+
+        updated_at = datetime.now(timezone.utc)
+        updated_after = self._transactions_updated_at - UPDATED_AFTER_OVERLAP
+        # the updated_after param changes on every call, so these responses are never reused
+        updated_transactions = self._get_transactions(
+            {"updated_after": updated_after.isoformat()}, cacheable=False
+        )
+
+        for updated_transaction in updated_transactions:
+            self._merge_transaction(updated_transaction)
+        self._transactions_updated_at = updated_at
+
+        return updated_transactions
+
+    def get_transaction(self, transaction_id: int) -> SwTransaction:
+        """Get a single transaction from the Splitwise API, and merge it into the cache."""
+        headers = {"Authorization": f"Bearer {self._key}", "accept": "application/json"}
+        url = f"https://secure.splitwise.com/api/v3.0/get_expense/{transaction_id}"
+
+        response = self._cache.get(
+            url, headers, lambda payload: SwTransaction(**payload["expense"])
+        )
+
+        transaction = response.value
+        self._merge_transaction(transaction)
+
+        return transaction
+
+    def get_user(self) -> SwUser:
+        """Get the currently authenticated user, with caching."""
+        headers = {"Authorization": f"Bearer {self._key}", "accept": "application/json"}
+        url = "https://secure.splitwise.com/api/v3.0/get_current_user"
+
+        # TODO: error handling
+        response = self._cache.get(
+            url,
+            headers,
+            lambda payload: SwUser(**payload["user"]),
+            ttl=self._identity_ttl,
+        )
+
+        return response.value
+
+    def _get_transactions(
+        self, params: dict = {}, cacheable: bool = True
+    ) -> list[SwTransaction]:
+        """Get every page of transactions matching the given params from the Splitwise API."""
         headers = {"Authorization": f"Bearer {self._key}", "accept": "application/json"}
         url = "https://secure.splitwise.com/api/v3.0/get_expenses"
 
         transactions: list[SwTransaction] = []
         offset = 0
         while True:
-            response = requests.get(url=url, headers=headers, params={"offset": offset})
-            response.raise_for_status()
+            response = self._cache.get(
+                url,
+                headers,
+                lambda payload: [SwTransaction(**txn) for txn in payload["expenses"]],
+                {**params, "offset": offset},
+                cacheable=cacheable,
+            )
 
-            response_transactions = [
-                SwTransaction(**txn) for txn in response.json()["expenses"]
-            ]
+            response_transactions = response.value
 
             if not response_transactions:
                 break
@@ -36,23 +112,15 @@ class SplitwiseClient:
             offset += len(response_transactions)
             transactions.extend(response_transactions)
 
-        self._transactions = transactions
-
         return transactions
 
-    def get_user(self) -> SwUser:
-        """Get the currently authenticated user, with caching."""
-        if self._user is not None:
-            return self._user
-
-        headers = {"Authorization": f"Bearer {self._key}", "accept": "application/json"}
-        url = "https://secure.splitwise.com/api/v3.0/get_current_user"
-
-        # TODO: error handling
-        response = requests.get(url=url, headers=headers)
-        response.raise_for_status()
-        response_dict = response.json()
-
-        self._user = SwUser(**response_dict["user"])
+    def _merge_transaction(self, transaction: SwTransaction) -> None:
+        """Replace the cached copy of the given transaction, dropping it if it has been deleted."""
+        if self._transactions is None:
+            return
 
-        return self._user
+        self._transactions = [
+            txn for txn in self._transactions if txn.id != transaction.id
+        ]
+        if transaction.deleted_at is None:
+            self._transactions.append(transaction)
@@ -35,6 +35,7 @@ class SwTransaction(BaseModel):
     cost: str
     date: str
     users: list[SwTransactionUser]
+    deleted_at: str | None = None
 
     def get_date(self) -> datetime:
         """Get the date of the transaction, as a datetime."""
@@ -17,6 +17,14 @@ class SplitwiseRetriever:
         self._logger = logging.getLogger("SplitwiseRetriever")
         self._logger.setLevel(logging.INFO)
 
+    def update_transactions(self) -> list[SwTransaction]:
+        """Refresh the cached transactions with any that have changed, and return the changed transactions."""
+        return self._client.update_transactions()
+
+    def get_transaction(self, transaction_id: int) -> SwTransaction:
+        """Fetch a single transaction, replacing any cached copy of it."""
+        return self._client.get_transaction(transaction_id)
+
     def get_matching_payment(
         self, amount: Decimal, timestamp: datetime, groups: list[int] = []
     ) -> SwTransaction | None:
@@ -35,6 +43,12 @@ class SplitwiseRetriever:
         [payment] = matching_payments
         return payment
 
+    def is_matching_payment(
+        self, transaction: SwTransaction, amount: Decimal, timestamp: datetime
+    ) -> bool:
+        """Check if the given transaction is a payment that matches the given amount and timestamp."""
+        return self._get_match_function(amount, timestamp)(transaction)
+
     def _get_match_function(
         self, amount: Decimal, timestamp: datetime
     ) -> Callable[[SwTransaction], bool]:
@@ -5,6 +5,7 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 
+from ..http_cache import ResponseCache
 from .client import SplitwiseClient
 from .model import SwTransaction
 from .retriever import SplitwiseRetriever
@@ -24,19 +25,38 @@ class SplitwiseService:
         self._logger.setLevel(logging.INFO)
 
     @classmethod
-    def factory(cls, key: str) -> SplitwiseService:
+    def factory(
+        cls,
+        key: str,
+        cache: ResponseCache | None = None,
+        identity_ttl: float = 3600,
+    ) -> SplitwiseService:
         """Factory method to create the Splitwise service."""
-        client = SplitwiseClient(key)
+        client = SplitwiseClient(key, cache, identity_ttl)
         retriever = SplitwiseRetriever(client)
         splitter = SplitwiseSplitter(client)
         return cls(retriever, splitter)
 
+    def update_expenses(self) -> list[SwTransaction]:
+        """Refresh the cached Splitwise transactions with any that have changed since they were last fetched."""
+        return self._retriever.update_transactions()
+
+    def refresh_expense(self, expense_id: int) -> SwTransaction:
+        """Fetch a single Splitwise transaction, replacing any cached copy of it."""
+        return self._retriever.get_transaction(expense_id)
+
     def get_matching_payment(
         self, amount: Decimal, timestamp: datetime, groups: list[int] = []
     ) -> SwTransaction | None:
         """Get the Splitwise payment that matches the given amount and timestamp."""
         return self._retriever.get_matching_payment(amount, timestamp, groups)
 
+    def is_matching_payment(
+        self, payment: SwTransaction, amount: Decimal, timestamp: datetime
+    ) -> bool:
+        """Check if the given Splitwise payment matches the given amount and timestamp."""
+        return self._retriever.is_matching_payment(payment, amount, timestamp)
+
     def get_constituent_expenses(
         self, payment: SwTransaction
     ) -> list[tuple[str, Decimal]] | None: